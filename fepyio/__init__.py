@@ -1,17 +1,22 @@
-from . import (
-    boundary,
-    control,
-    globals,
-    load_data,
-    loads,
-    material,
-    material_types,
-    mesh,
-    mesh_domains,
-    module,
-    output,
-)
-from .feb import Feb
+import importlib
+import sys
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from . import (
+        boundary,
+        control,
+        globals,
+        load_data,
+        loads,
+        material,
+        material_types,
+        mesh,
+        mesh_domains,
+        module,
+        output,
+    )
+    from .feb import Feb
 
 __all__ = [
     "Feb",
@@ -27,3 +32,19 @@ __all__ = [
     "module",
     "output",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import submodules and Feb on first access to keep `import fepyio` fast."""
+    if name == "Feb":
+        from .feb import Feb
+
+        return Feb
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    # globals() would be shadowed by the fepyio.globals submodule once it is imported
+    return sorted(set(vars(sys.modules[__name__])) | set(__all__))
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import Literal
+from typing import ClassVar, Literal
 
 from .feb_base import FebBase, FebEnum
 
@@ -46,7 +46,7 @@ class BoundaryCondition(FebBase):
     name: str
     node_set: str
     type: BoundaryType
-    _key: str = field(default="bc", init=False)
+    _key: ClassVar[str] = "bc"
 
 
 @dataclass
@@ -86,7 +86,7 @@ class FixedBoundary(BoundaryCondition):
             "@name": self.name,
             "@type": self.type.get_value(),
             "@node_set": self.node_set,
-            "dofs": ",".join(map(str, self.dofs)),
+            "dofs": ",".join(self.dofs),
         }
 
 
@@ -115,8 +115,14 @@ class Boundary(FebBase):
 
     boundary_conditions: list[BoundaryCondition]
 
+    # Field names with custom keys
+    _key_lookup: ClassVar[dict[str, str]] = {
+        "boundary_conditions": "bc",
+    }
+
     def _convert_key(self, key: str) -> str:
-        key_lookup = {
-            "boundary_conditions": "bc",
-        }
-        return key_lookup[key] if key in key_lookup else super()._convert_key(key)
+        return (
+            self._key_lookup[key]
+            if key in self._key_lookup
+            else super()._convert_key(key)
+        )
@@ -1,3 +1,6 @@
+from dataclasses import fields
+from typing import Callable, Type, get_type_hints
+
 import numpy as np
 from dacite.core import from_dict
 from dacite.exceptions import DaciteError
@@ -7,6 +10,52 @@ from fepyio.exceptions import UnknownMaterialError
 from .material_types import BaseMaterial, material_dict
 
 
+def _material_builder(
+    material_class: Type[BaseMaterial],
+) -> Callable[[dict], BaseMaterial]:
+    """Return a function that creates a `material_class` instance from a dictionary.
+
+    Type hints are resolved once here instead of on every dacite.from_dict() call. Data
+    with every init field present and of the hinted type is passed straight to the
+    constructor. Anything else goes through dacite.from_dict(), so defaults are filled in
+    and dacite's errors are raised for missing or mistyped values.
+    """
+    hints = get_type_hints(material_class)
+    init_types = [
+        (field.name, hints[field.name])
+        for field in fields(material_class)
+        if field.init
+    ]
+
+    # Only plain classes can be checked with isinstance()
+    if not all(isinstance(_type, type) for (_, _type) in init_types):
+        return lambda data: from_dict(data_class=material_class, data=data)
+
+    # Floats also accept ints, like dacite does
+    checks = [
+        (name, (int, float) if _type is float else _type)
+        for (name, _type) in init_types
+    ]
+
+    def _build(data: dict) -> BaseMaterial:
+        if all(
+            name in data and isinstance(data[name], _type) for (name, _type) in checks
+        ):
+            return material_class(**{name: data[name] for (name, _) in checks})
+
+        return from_dict(data_class=material_class, data=data)
+
+    return _build
+
+
+_material_builders: dict[Type[BaseMaterial], Callable[[dict], BaseMaterial]] = {}
+"""Functions to create each material class from a dictionary, keyed by material class.
+
+Filled by convert_to_materials() the first time each material class is used. Keying on
+the class means a material type registered again uses the builder for its new class.
+"""
+
+
 def convert_to_materials(
     element_materials: np.ndarray, materials_dict: dict[str, dict]
 ) -> list[BaseMaterial]:
@@ -35,6 +84,9 @@ def convert_to_materials(
     List of BaseMaterial
     """
 
+    # get unique set of materials in the tetmesh
+    unique_mats = set(np.unique(element_materials).tolist())
+
     # create empty list of BaseMaterials
     material_list: list[BaseMaterial] = []
 
@@ -59,13 +111,11 @@ def convert_to_materials(
 
         # Create a new material dataclass based on the data
         try:
-            material_list.append(
-                from_dict(data_class=material_dict[mat_type], data=_data)
-            )
+            material_class = material_dict[mat_type]
+            if material_class not in _material_builders:
+                _material_builders[material_class] = _material_builder(material_class)
+            material_list.append(_material_builders[material_class](_data))
         except DaciteError:
             raise
 
-    # get unique list of materials in the tetmesh
-    unique_mats = np.unique(element_materials)
-
     return [material for material in material_list if material.id in unique_mats]
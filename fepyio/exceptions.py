@@ -18,6 +18,8 @@ class ArrayShapeError(Exception):
         Expected shape.
     """
 
+    _default_message = "Expected shape {expected_shape} for '{array_name}', but got {array_shape}{extra}."
+
     @overload
     def __init__(
         self,
@@ -94,17 +96,14 @@ class ArrayShapeError(Exception):
         self.array_name = array_name
         self.array_shape = array_shape
         self.expected_shape = expected_shape
-        self.message = (
-            message
-            if message is not None
-            else "Expected shape {expected_shape} for '{array_name}', but got {array_shape}{extra}."
-        )
+        self.message = message if message is not None else self._default_message
         self.extra = extra or ""
 
         if kwargs:
             self.__dict__.update(kwargs)
 
     def __str__(self):
+        # Formatted on every call, so later changes to the attributes are reflected
         return self.message.format(**self.__dict__)
 
 
@@ -1,7 +1,5 @@
 from dataclasses import dataclass
 
-import xmltodict
-
 from fepyio.boundary import Boundary
 from fepyio.control import Control
 from fepyio.globals import Globals
@@ -12,6 +10,7 @@ from fepyio.mesh import Mesh
 from fepyio.mesh_domains import MeshDomains
 from fepyio.module import Module
 from fepyio.output import Output
+from fepyio.utils.xml_writer import XmlWriter
 
 from .feb_base import FebBase
 
@@ -87,6 +86,23 @@ class Feb(FebBase):
         Returns
         -------
         None
+
+        Notes
+        -----
+        The file is streamed one element at a time, so the dictionary from to_dict() is
+        never built for the whole model. The output is the same as passing to_dict() to
+        ``xmltodict.unparse(..., pretty=True)``.
         """
-        with open(filepath, "wb") as out_file:
-            xmltodict.unparse(self.to_dict(), out_file, pretty=True)
+        # 1 MiB buffer so the many small element writes go out in few system calls
+        with open(
+            filepath,
+            "w",
+            buffering=1024 * 1024,
+            encoding="utf-8",
+            errors="xmlcharrefreplace",
+            newline="\n",
+        ) as out_file:
+            writer = XmlWriter(out_file)
+            writer.start_document()
+            # Feb.to_dict() only wraps the fields in the top-level key
+            self._write_fields(writer, self._key)
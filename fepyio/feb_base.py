@@ -1,13 +1,18 @@
 """
 Contains base classes for FEB module
 """
+from collections.abc import Sized
 from dataclasses import dataclass, fields
 from enum import Enum
-from typing import Any
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Callable, Iterator, TypeVar
 
-from fepyio.utils.dict_utils import prune_dict, unlist_dict
+from fepyio.utils.xml_writer import XmlWriter
 from fepyio.utils.xmltodict_key_converter import prop_to_xml
 
+T = TypeVar("T", bound=type)
+
 
 @dataclass
 class FebBase:
@@ -22,58 +27,228 @@ class FebBase:
     -------
     to_dict()
         Get the class as a dict from fields.
+    _cached_fields()
+        Get the names of the class fields used by to_dict(). Cached per class.
+    _cached_getter()
+        Get a function that reads all _cached_fields() values at once. Cached per class.
+    _cached_keys()
+        Get the converted keys of the class fields. Cached per class.
     _convert_key(key: str)
         Convert an internal field name to key for dictionary. Can be overwritten to
-        change key names while maintaining default to_dict().
+        change key names while maintaining default to_dict(). Field name results are
+        cached per class, so it should only depend on `key`.
+    _write_xml(writer: XmlWriter, key: str, depth: int, skip_empty: bool)
+        Write the class as an XML element. Can be overwritten to write large arrays
+        directly instead of through to_dict().
     """
 
+    # No per-instance storage is needed by the base class
+    __slots__ = ()
+
     @property
     def _key(self) -> str:
         """Return key used for class name. Defaults to class name."""
         return self.__class__.__name__
 
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _cached_fields(cls) -> tuple[str, ...]:
+        """Return names of the dataclass fields, excluding '_key'. Cached per class."""
+        return tuple(field.name for field in fields(cls) if field.name != "_key")
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _cached_getter(cls) -> Callable[[Any], tuple]:
+        """Return a function that gets a tuple of the _cached_fields() values."""
+        names = cls._cached_fields()
+        if not names:
+            return lambda obj: ()
+        if len(names) == 1:
+            # attrgetter() only returns a tuple for more than one name
+            return lambda obj: (getattr(obj, names[0]),)
+        return attrgetter(*names)
+
+    def _cached_keys(self) -> tuple[str, ...]:
+        """Return _convert_key() of every _cached_fields() name. Cached per class."""
+        cls = type(self)
+        if cls not in _field_keys:
+            _field_keys[cls] = tuple(
+                self._convert_key(name) for name in cls._cached_fields()
+            )
+        return _field_keys[cls]
+
     def _convert_key(self, key: str) -> str:
         return prop_to_xml(key)
 
+    def _items(self) -> Iterator[tuple[str, Any]]:
+        """Yield (key, value) pairs of the non-empty fields, in field order.
+
+        FebBase values, including those inside lists, are not converted.
+        """
+        for (key, field_val) in zip(self._cached_keys(), self._cached_getter()(self)):
+            # Skip empty fields
+            if field_val is None:
+                continue
+
+            if isinstance(field_val, FebEnum):
+                # Extract enum value
+                yield (key, field_val.get_value())
+            elif isinstance(field_val, FebBase):
+                # We want to use the FebBase's key instead of whatever the parent has
+                # called it
+                yield (self._convert_key(field_val._key), field_val)
+            else:
+                # Field name is already converted to an xmltodict-compatible name
+                yield (key, field_val)
+
     def to_dict(self) -> dict:
         """Get class as dictionary."""
         _dict: dict = {}
 
-        def _to_dict(value) -> tuple[str, Any]:
-            # If the field value is another FebBase object, recursively get dictionary.
-            # Additionally, we want to use the FebBase's key instead of whatever the
-            # parent has called it
-            if isinstance(value, FebBase):
-                return (self._convert_key(value._key), value.to_dict())
+        for (key, value) in zip(self._cached_keys(), self._cached_getter()(self)):
+            # Fast path for the most common field values
+            value_type = type(value)
+            if value_type in _scalar_types:
+                if value_type is not str or value:
+                    _dict[key] = value
+                continue
 
-            else:
-                # Convert field name to xmltodict-compatible name
-                return (self._convert_key(field.name), value)
+            if value is None:
+                continue
 
-        for field in fields(self):
-            # Skip '_key' field
-            if field.name == "_key":
+            if isinstance(value, FebEnum):
+                value = value.get_value()
+            elif isinstance(value, FebBase):
+                # We want to use the FebBase's key instead of whatever the parent has
+                # called it
+                key = self._convert_key(value._key)
+                value = value.to_dict()
+            elif isinstance(value, list):
+                if not value:
+                    # Skip empty lists, such as unused LogFile data, without copying
+                    continue
+                if len(value) == 1:
+                    # Replace single item lists with the item, like unlist_dict()
+                    value = value[0]
+                    value = value.to_dict() if isinstance(value, FebBase) else value
+                else:
+                    # Add each element of list to the dictionary. Inlined since lists
+                    # such as Boundary.boundary_conditions can be long.
+                    value = [
+                        item.to_dict() if isinstance(item, FebBase) else item
+                        for item in value
+                    ]
+
+            # Skip empty values, like prune_dict(..., prune_empty_iterables=True)
+            if value is None or (isinstance(value, Sized) and len(value) == 0):
                 continue
 
-            field_val = getattr(self, field.name)
+            _dict[key] = value
 
-            # Skip empty fields
-            if field_val is None:
+        return _dict
+
+    def _write_xml(
+        self, writer: XmlWriter, key: str, depth: int = 0, skip_empty: bool = False
+    ) -> None:
+        """Write class as an XML element named `key`.
+
+        Classes that overwrite to_dict() are written from its result. Otherwise, fields
+        are streamed to `writer` one at a time with _write_fields().
+
+        Parameters
+        ----------
+        writer : XmlWriter
+            Writer for the output file.
+        key : str
+            Element name.
+        depth : int, default=0
+            Element depth, used for indentation.
+        skip_empty : bool, default=False
+            Do not write the element if it has no content, like prune_dict() would.
+        """
+        if type(self).to_dict is not FebBase.to_dict:
+            _dict = self.to_dict()
+            if _dict or not skip_empty:
+                writer.emit(key, _dict, depth)
+        else:
+            self._write_fields(writer, key, depth, skip_empty)
+
+    def _write_fields(
+        self, writer: XmlWriter, key: str, depth: int = 0, skip_empty: bool = False
+    ) -> None:
+        """Stream fields to `writer` as an XML element, following rules of to_dict()."""
+        text = None
+        attrs = {}
+        children = []
+        for (item_key, value) in self._items():
+            # Unwrap single item lists and skip empty values, like to_dict()
+            if isinstance(value, list) and len(value) == 1:
+                value = value[0]
+            if value is None or (isinstance(value, Sized) and len(value) == 0):
                 continue
 
-            if isinstance(field_val, list):
-                # Add each element of list to the dictionary
-                _dict[self._convert_key(field.name)] = [
-                    _to_dict(value)[1] for value in field_val
-                ]
-            elif isinstance(field_val, FebEnum):
-                # Extract enum value
-                _dict[self._convert_key(field.name)] = field_val.get_value()
+            if isinstance(value, FebBase) or not item_key.startswith(("@", "#")):
+                children.append((item_key, value))
+            elif item_key == "#text":
+                text = value
+            else:
+                attrs[item_key[1:]] = value
+
+        writer.start_element(key, attrs, depth)
+        for (child_key, child) in children:
+            if isinstance(child, FebBase):
+                child._write_xml(writer, child_key, depth + 1, skip_empty=True)
+            elif isinstance(child, list):
+                for item in child:
+                    if isinstance(item, FebBase):
+                        item._write_xml(writer, child_key, depth + 1)
+                    else:
+                        writer.emit(child_key, item, depth + 1)
             else:
-                key, value = _to_dict(field_val)
-                _dict[key] = value
+                writer.emit(child_key, child, depth + 1)
+        if text:
+            writer.characters(str(text))
+        writer.end_element(skip_empty=skip_empty)
+
+
+def add_slots(cls: T) -> T:
+    """Class decorator that recreates a dataclass with __slots__ for its fields.
+
+    Backport of ``dataclass(slots=True)`` from Python 3.10. Instances have no __dict__,
+    which saves memory for classes with many instances. Must be applied above
+    @dataclass, and the class must not use zero-argument super().
+
+    Example
+    -------
+    >>> @add_slots
+    ... @dataclass
+    ... class Point:
+    ...     x: int
+    ...     y: int = 0
+    >>> Point.__slots__, Point(1)
+    (('x', 'y'), Point(x=1, y=0))
+    """
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(field.name for field in fields(cls))
+    cls_dict["__slots__"] = field_names
+
+    # Remove class attributes that would conflict with the slots. Field defaults are
+    # kept by the generated __init__.
+    for name in field_names:
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+
+    slots_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slots_cls.__qualname__ = cls.__qualname__
+    return slots_cls
+
+
+_scalar_types = frozenset({int, float, bool, str})
+"""Field value types that FebBase.to_dict() can use without conversion."""
 
-        return prune_dict(unlist_dict(_dict), prune_empty_iterables=True)
+_field_keys: dict[type, tuple[str, ...]] = {}
+"""Converted field keys of each FebBase subclass, filled by FebBase._cached_keys()."""
 
 
 class FebEnum(Enum):
@@ -86,4 +261,5 @@ class FebEnum(Enum):
 
     def get_value(self):
         """Generic get value. Can be overrwritten."""
-        return self.value
+        # Same as self.value, but skips the slow Enum.value descriptor
+        return self._value_
@@ -1,4 +1,4 @@
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 
 from .feb_base import FebBase
 
@@ -36,4 +36,4 @@ class Globals(FebBase):
     Fc: float = 0
 
     def to_dict(self):
-        return {"Constants": asdict(self)}
+        return {"Constants": {"R": self.R, "T": self.T, "Fc": self.Fc}}
@@ -6,7 +6,7 @@ from typing import Literal, Optional, Union
 import numpy as np
 
 from fepyio.exceptions import ArrayShapeError
-from fepyio.utils.dict_utils import prune_dict
+from fepyio.utils.array_utils import join_rows
 
 from .feb_base import FebBase, FebEnum
 
@@ -87,7 +87,9 @@ class LoadCurve(LoadController):
     See: [FEBio Manual section 3.17.1](https://help.febio.org/FebioUser/FEBio_um_3-4-Subsection-3.17.1.html).
     """
 
-    points: Union[list[tuple[float, float]], np.ndarray] = np.empty(shape=(0, 2))
+    points: Union[list[tuple[float, float]], np.ndarray] = field(
+        default_factory=lambda: np.empty(shape=(0, 2))
+    )
     interpolate: Optional[Literal["step", "linear", "smooth"]] = None
     extra: Optional[
         Literal["constant", "extrapolate", "repeat", "repeat offset"]
@@ -115,22 +117,27 @@ class LoadCurve(LoadController):
             )
 
     def to_dict(self):
-        def _try_upper(s: Optional[str]) -> Optional[str]:
-            """Try to return s.upper() otherwise return s"""
-            return s.upper() if s is not None else None
-
         # Create list of comma-separated (x,y) coordinates from points
-        _points = [",".join(map(str, point)) for point in self.points]
+        _points = (
+            join_rows(self.points)
+            if isinstance(self.points, np.ndarray)
+            else [",".join(map(str, point)) for point in self.points]
+        )
 
         _dict = {
             "@id": self.id,
             "@type": self.type.get_value(),
-            "interpolate": _try_upper(self.interpolate),
-            "extra": _try_upper(self.extra),
-            "points": {"point": _points},
         }
 
-        return prune_dict(_dict)
+        # Only add optional values that are set
+        if self.interpolate is not None:
+            _dict["interpolate"] = self.interpolate.upper()
+        if self.extra is not None:
+            _dict["extra"] = self.extra.upper()
+
+        _dict["points"] = {"point": _points}
+
+        return _dict
 
     @classmethod
     def linear_curve(cls, id: int) -> LoadCurve:
@@ -1,7 +1,5 @@
 from dataclasses import dataclass, field
-from typing import Optional
-
-from fepyio.utils.dict_utils import prune_dict
+from typing import ClassVar, Optional
 
 from .feb_base import FebBase, FebEnum
 
@@ -35,7 +33,7 @@ class SurfaceLoad(FebBase):
     name: str
     surface: str
     type: SurfaceLoadType
-    _key: str = field(default="surface_load", init=False)
+    _key: ClassVar[str] = "surface_load"
 
 
 @dataclass
@@ -91,9 +89,6 @@ class PressureLoad(SurfaceLoad):
     type: SurfaceLoadType = field(default=SurfaceLoadType.PRESSURE, init=False)
 
     def to_dict(self):
-        def _bint(b: Optional[bool]) -> Optional[int]:
-            return int(b) if b is not None else None
-
         # Create dictionary for pressure if custom load curve is specified
         _pressure = (
             {"@lc": self.load_curve, "#text": str(self.pressure)}
@@ -106,13 +101,17 @@ class PressureLoad(SurfaceLoad):
             "@surface": self.surface,
             "@type": self.type.get_value(),
             "pressure": _pressure,
-            "symmetric_stiffness": _bint(self.symmetric_stiffness),
-            "linear": _bint(self.linear),
-            "shell_bottom": _bint(self.shell_bottom),
         }
 
-        # Prune None values
-        return prune_dict(_dict)
+        # Only add optional flags that are set, as ints
+        if self.symmetric_stiffness is not None:
+            _dict["symmetric_stiffness"] = int(self.symmetric_stiffness)
+        if self.linear is not None:
+            _dict["linear"] = int(self.linear)
+        if self.shell_bottom is not None:
+            _dict["shell_bottom"] = int(self.shell_bottom)
+
+        return _dict
 
 
 @dataclass
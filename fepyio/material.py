@@ -1,4 +1,6 @@
 from dataclasses import dataclass, fields
+from operator import attrgetter
+from typing import Callable, ClassVar
 
 from fepyio.utils.dict_utils import unlist_dict
 
@@ -28,27 +30,40 @@ class Material(FebBase):
 
     materials: list[BaseMaterial]
 
+    # Functions converting each material class to a dict, filled by _material_to_dict()
+    _material_converters: ClassVar[dict[type, Callable[[BaseMaterial], dict]]] = {}
+
     def _convert_key(self, key: str) -> str:
         if key in {"id", "name", "type"}:
             return f"@{key}"
         else:
             return super()._convert_key(key)
 
-    def to_dict(self):
-        def _getattr(material: BaseMaterial, name: str):
-            # BaseMaterial.type is an Enum. We want to get the string key out of it.
-            if name == "type":
-                return getattr(material, name).value
-            else:
-                return getattr(material, name)
+    def _material_to_dict(self, material: BaseMaterial) -> dict:
+        """Convert a material to a dictionary, with a converter built once per class."""
+        material_class = type(material)
+
+        if material_class not in self._material_converters:
+            names = tuple(field.name for field in fields(material_class))
+            keys = tuple(self._convert_key(name) for name in names)
+            # BaseMaterial always has more than one field, so this returns a tuple
+            get_values = attrgetter(*names)
+            type_key = self._convert_key("type")
+
+            def _convert(material: BaseMaterial) -> dict:
+                _dict = dict(zip(keys, get_values(material)))
+                # BaseMaterial.type is an Enum. We want to get the string key out of it.
+                _dict[type_key] = _dict[type_key].value
+                return _dict
 
+            self._material_converters[material_class] = _convert
+
+        return self._material_converters[material_class](material)
+
+    def to_dict(self):
         _dict = {
             "material": [
-                {
-                    self._convert_key(field.name): _getattr(material, field.name)
-                    for field in fields(material)
-                }
-                for material in self.materials
+                self._material_to_dict(material) for material in self.materials
             ]
         }
 
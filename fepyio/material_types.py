@@ -35,6 +35,29 @@ class BaseMaterial:
     type: MaterialType
 
 
+material_dict: dict[str, Type[BaseMaterial]] = {}
+"""Dictionary of FEBio material classes.
+
+keys are the material type as a string and values are the material class (not instance)
+"""
+
+
+def register_material(material_class: Type[BaseMaterial]) -> Type[BaseMaterial]:
+    """Class decorator that adds a BaseMaterial subclass to `material_dict`.
+
+    The key is the value of the class's default `type`.
+
+    Example
+    -------
+    >>> NeoHookean is material_dict["neo-Hookean"]
+    True
+    """
+    material_type = material_class.__dataclass_fields__["type"].default
+    material_dict[material_type.value] = material_class
+    return material_class
+
+
+@register_material
 @dataclass
 class NeoHookean(BaseMaterial):
     """Neo-Hookean FEBio material.
@@ -64,6 +87,7 @@ class NeoHookean(BaseMaterial):
     type: MaterialType = field(default=MaterialType.NEO_HOOKEAN, init=False)
 
 
+@register_material
 @dataclass
 class CoupledMooneyRivlin(BaseMaterial):
     """Coupled Mooney-Rivlin FEBio material.
@@ -109,12 +133,3 @@ class CoupledMooneyRivlin(BaseMaterial):
     c2: float
     k: float
     type: MaterialType = field(default=MaterialType.COUPLED_MOONEY_RIVLIN, init=False)
-
-
-material_dict: dict[str, Type[BaseMaterial]] = {
-    material.type.value: material for material in BaseMaterial.__subclasses__()
-}
-"""Dictionary of FEBio material classes.
-
-keys are the material type as a string and values are the material class (not instance)
-"""
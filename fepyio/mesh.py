@@ -1,14 +1,17 @@
 from __future__ import annotations
 
+from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import ClassVar, Optional, Union
 
 import numpy as np
 
 from fepyio.exceptions import ArrayShapeError
-from fepyio.utils.dict_utils import prune_dict, unlist_dict
+from fepyio.utils.array_utils import join_rows, row_ids
+from fepyio.utils.dict_utils import unlist_dict
+from fepyio.utils.xml_writer import XmlWriter
 
-from .feb_base import FebBase, FebEnum
+from .feb_base import FebBase, FebEnum, add_slots
 
 
 @dataclass
@@ -63,19 +66,28 @@ class Nodes(FebBase):
             )
 
     def to_dict(self):
-        _dict = {
-            "@name": self.name,
-            "node": [
-                {
-                    "@id": _id,
-                    "#text": ",".join(map(str, coord)),
-                }
-                for _id, coord in zip(self.ids, self.coords)
-            ],
-        }
+        _dict: dict = {"@name": self.name}
+        nodes = [
+            {
+                "@id": _id,
+                "#text": text,
+            }
+            for _id, text in zip(row_ids(self.ids), join_rows(self.coords))
+        ]
+        # Empty lists still open the element in xmltodict.unparse(), so skip them
+        if nodes:
+            _dict["node"] = nodes
 
         return unlist_dict(_dict)
 
+    def _write_xml(
+        self, writer: XmlWriter, key: str, depth: int = 0, skip_empty: bool = False
+    ) -> None:
+        # Write nodes directly instead of building a dict for each one
+        writer.start_element(key, {"name": self.name}, depth)
+        writer.write_rows("node", row_ids(self.ids), join_rows(self.coords), depth + 1)
+        writer.end_element()
+
 
 class ElementType(FebEnum):
     """Type of FEBio elements"""
@@ -91,6 +103,20 @@ class ElementType(FebEnum):
     TET15 = "tet15"
 
 
+_element_num_nodes: dict[ElementType, int] = {
+    ElementType.HEX8: 8,
+    ElementType.HEX20: 20,
+    ElementType.HEX27: 27,
+    ElementType.PENTA6: 6,
+    ElementType.PENTA15: 15,
+    ElementType.PYRA5: 5,
+    ElementType.TET4: 4,
+    ElementType.TET10: 10,
+    ElementType.TET15: 15,
+}
+"""Number of nodes in each ElementType."""
+
+
 @dataclass
 class Elements(FebBase):
     """FEBio > Mesh > Elements
@@ -131,10 +157,7 @@ class Elements(FebBase):
     ids: np.ndarray
 
     def __post_init__(self):
-        # Extract digits from string and cast to int
-        num_elements = int(
-            "".join([ch for ch in self.type.get_value() if ch.isnumeric()])
-        )
+        num_elements = _element_num_nodes[self.type]
 
         # Check to make sure 'num_elements' == elements.shape
         if self.elements.ndim != 2 or self.elements.shape[1] != num_elements:
@@ -152,20 +175,32 @@ class Elements(FebBase):
             )
 
     def to_dict(self):
-        _dict = {
-            "@type": self.type.get_value(),
-            "@name": self.name,
-            "elem": [
-                {
-                    "@id": _id,
-                    "#text": ",".join(map(str, node)),
-                }
-                for _id, node in zip(self.ids, self.elements)
-            ],
-        }
+        _dict: dict = {"@type": self.type.get_value(), "@name": self.name}
+        elements = [
+            {
+                "@id": _id,
+                "#text": text,
+            }
+            for _id, text in zip(row_ids(self.ids), join_rows(self.elements))
+        ]
+        # Empty lists still open the element in xmltodict.unparse(), so skip them
+        if elements:
+            _dict["elem"] = elements
 
         return unlist_dict(_dict)
 
+    def _write_xml(
+        self, writer: XmlWriter, key: str, depth: int = 0, skip_empty: bool = False
+    ) -> None:
+        # Write elements directly instead of building a dict for each one
+        writer.start_element(
+            key, {"type": self.type.get_value(), "name": self.name}, depth
+        )
+        writer.write_rows(
+            "elem", row_ids(self.ids), join_rows(self.elements), depth + 1
+        )
+        writer.end_element()
+
 
 @dataclass
 class NodeSet(FebBase):
@@ -207,13 +242,15 @@ class NodeSet(FebBase):
             )
 
     def to_dict(self):
-        return prune_dict(
-            {
-                "@name": self.name,
-                "node": self.node_ids,
-                "node_sets": self.node_sets,
-            }
-        )
+        _dict: dict = {"@name": self.name}
+
+        # Only add optional values that are set
+        if self.node_ids is not None:
+            _dict["node"] = self.node_ids
+        if self.node_sets is not None:
+            _dict["node_sets"] = self.node_sets
+
+        return _dict
 
 
 class FaceType(FebEnum):
@@ -224,6 +261,36 @@ class FaceType(FebEnum):
     TRI7 = "tri7"
 
 
+_face_num_nodes: dict[FaceType, int] = {
+    FaceType.QUAD4: 4,
+    FaceType.QUAD8: 8,
+    FaceType.TRI3: 3,
+    FaceType.TRI6: 6,
+    FaceType.TRI7: 7,
+}
+"""Number of nodes in each FaceType."""
+
+
+def _check_face_arrays(type: FaceType, ids: np.ndarray, nodes: np.ndarray) -> None:
+    """Raise ArrayShapeError unless `nodes` is (n, t) and `ids` is (n,) for `type`."""
+    num_elements = _face_num_nodes[type]
+
+    if nodes.ndim != 2 or nodes.shape[1] != num_elements:
+        raise ArrayShapeError(
+            array_shape=nodes.shape,
+            array_name="nodes",
+            expected_shape=f"(n, {num_elements})",
+            extra=f"for type '{type}'",
+        )
+    if ids.ndim != 1 or ids.shape[0] != nodes.shape[0]:
+        raise ArrayShapeError(
+            array_shape=ids.shape,
+            array_name="ids",
+            expected_shape=f"({nodes.shape[0]},)",
+        )
+
+
+@add_slots
 @dataclass
 class Face(FebBase):
     """FEBio > Mesh > Surface > Face
@@ -256,10 +323,7 @@ class Face(FebBase):
     _key: Optional[str] = None  # type: ignore
 
     def __post_init__(self):
-        # Extract digits from string and cast to int
-        num_elements = int(
-            "".join([ch for ch in self.type.get_value() if ch.isnumeric()])
-        )
+        num_elements = _face_num_nodes[self.type]
 
         # Check to make sure 'num_elements' == nodes.shape
         if self.nodes.ndim != 1 or self.nodes.shape != (num_elements,):
@@ -274,6 +338,84 @@ class Face(FebBase):
         if self._key is None:
             self._key = self.type.get_value()
 
+    @classmethod
+    def from_array(
+        cls, type: FaceType, ids: np.ndarray, nodes: np.ndarray
+    ) -> list[Face]:
+        """Create a Face of `type` for each row of `nodes`.
+
+        Shapes are checked once for the whole array instead of in every Face's
+        __post_init__.
+
+        Parameters
+        ----------
+        type : FaceType
+            Face type of every face.
+        ids : np.ndarray
+            (n,) Numpy array of face ids, where 'n' is the number of faces.
+        nodes : np.ndarray
+            (n, t) Numpy array of node indices, where 't' is the number in 'type'.
+
+        Returns
+        -------
+        list of Face
+
+        Example
+        -------
+        >>> faces = Face.from_array(FaceType.TRI3, np.array([1]), np.array([[1, 2, 3]]))
+        >>> faces[0].id, faces[0].nodes, faces[0]._key
+        (1, array([1, 2, 3]), 'tri3')
+        """
+        _check_face_arrays(type, ids, nodes)
+
+        key = type.get_value()
+        faces = []
+        for (_id, face_nodes) in zip(row_ids(ids), nodes):
+            # Skip __init__ and __post_init__ since the shapes are already checked
+            face = cls.__new__(cls)
+            face.type = type
+            face.id = _id
+            face.nodes = face_nodes
+            face._key = key
+            faces.append(face)
+
+        return faces
+
+
+@dataclass
+class Faces:
+    """FEBio > Mesh > Surface > Face, for many faces of one type.
+
+    Stores faces as arrays instead of one Face object per face, which uses much less
+    memory for large surfaces. Not a FebBase since it is not an FEBio element on its
+    own; Surface writes its faces as rows.
+
+    Parameters
+    ----------
+    type : FaceType
+        Face type of every face. Describes how many nodes.
+    ids : np.ndarray
+        (n,) Numpy array of face ids, where 'n' is the number of faces.
+    nodes : np.ndarray
+        (n, t) Numpy array of node indices, where 't' is the number in 'type'.
+
+    Attributes
+    ----------
+    type : FaceType
+        Face type of every face. Describes how many nodes.
+    ids : np.ndarray
+        (n,) Numpy array of face ids, where 'n' is the number of faces.
+    nodes : np.ndarray
+        (n, t) Numpy array of node indices, where 't' is the number in 'type'.
+    """
+
+    type: FaceType
+    ids: np.ndarray
+    nodes: np.ndarray
+
+    def __post_init__(self):
+        _check_face_arrays(self.type, self.ids, self.nodes)
+
 
 @dataclass
 class Surface(FebBase):
@@ -283,15 +425,15 @@ class Surface(FebBase):
     ----------
     name : str
         Name of surface.
-    faces : list of Face
-        List of faces.
+    faces : list of Face or Faces
+        List of faces. Faces stores many faces of one type as arrays.
 
     Attributes
     ----------
     name : str
         Name of surface.
-    faces : list of Face
-        List of faces.
+    faces : list of Face or Faces
+        List of faces. Faces stores many faces of one type as arrays.
     _key = "Surface"
 
     Notes
@@ -300,9 +442,25 @@ class Surface(FebBase):
     """
 
     name: str
-    faces: list[Face]
+    faces: list[Union[Face, Faces]]
+
+    @classmethod
+    def from_arrays(
+        cls, name: str, type: FaceType, ids: np.ndarray, nodes: np.ndarray
+    ) -> Surface:
+        """Create a Surface of faces of one `type` stored as arrays.
+
+        Example
+        -------
+        >>> surface = Surface.from_arrays(
+        ...     "surface_1", FaceType.TRI3, np.array([1]), np.array([[1, 2, 3]])
+        ... )
+        >>> surface.to_dict()
+        {'@name': 'surface_1', 'tri3': {'@id': 1, '#text': '1,2,3'}}
+        """
+        return cls(name=name, faces=[Faces(type=type, ids=ids, nodes=nodes)])
 
-    def _group_faces(self) -> dict[str, list[Face]]:
+    def _group_faces(self) -> dict[str, list[Union[Face, Faces]]]:
         """Return dictionary of faces grouped by type.
 
         Return:
@@ -312,28 +470,46 @@ class Surface(FebBase):
         # if isinstance(self.faces, Face):
         #     return {self.faces.type: [self.faces]}
 
-        grouped_faces: dict[str, list[Face]] = {}
+        grouped_faces: defaultdict[str, list[Union[Face, Faces]]] = defaultdict(list)
 
         # Group faces
         for face in self.faces:
-            if face.type.get_value() not in grouped_faces:
-                grouped_faces[face.type.get_value()] = [face]
-            else:
-                grouped_faces[face.type.get_value()].append(face)
+            grouped_faces[face.type.get_value()].append(face)
 
         # Un-list types containing a single face
-        return grouped_faces
+        return dict(grouped_faces)
+
+    def _group_rows(self) -> dict[str, tuple[list, list[str]]]:
+        """Return (ids, comma-separated nodes) of the faces, grouped by type."""
+        grouped_rows = {}
+
+        for (key, faces) in self._group_faces().items():
+            ids: list = []
+            texts: list[str] = []
+            for face in faces:
+                if isinstance(face, Faces):
+                    # Format all faces in the arrays at once
+                    ids.extend(row_ids(face.ids))
+                    texts.extend(join_rows(face.nodes))
+                else:
+                    ids.append(face.id)
+                    texts.append(",".join(map(str, face.nodes)))
+            grouped_rows[key] = (ids, texts)
+
+        return grouped_rows
 
     def to_dict(self):
         grouped_faces = {
             key: [
                 {
-                    "@id": face.id,
-                    "#text": ",".join(map(str, face.nodes)),
+                    "@id": _id,
+                    "#text": text,
                 }
-                for face in faces
+                for (_id, text) in zip(ids, texts)
             ]
-            for (key, faces) in self._group_faces().items()
+            for (key, (ids, texts)) in self._group_rows().items()
+            # Empty lists still open the element in xmltodict.unparse(), so skip them
+            if ids
         }
 
         unlist_grouped_faces = unlist_dict(grouped_faces)
@@ -342,6 +518,15 @@ class Surface(FebBase):
         _dict.update(**unlist_grouped_faces)
         return _dict
 
+    def _write_xml(
+        self, writer: XmlWriter, key: str, depth: int = 0, skip_empty: bool = False
+    ) -> None:
+        # Write faces directly instead of building a dict for each one
+        writer.start_element(key, {"name": self.name}, depth)
+        for (face_type, (ids, texts)) in self._group_rows().items():
+            writer.write_rows(face_type, ids, texts, depth + 1)
+        writer.end_element()
+
 
 @dataclass
 class Mesh(FebBase):
@@ -382,11 +567,17 @@ class Mesh(FebBase):
     node_sets: list[NodeSet] = field(default_factory=lambda: [])
     surfaces: list[Surface] = field(default_factory=lambda: [])
 
+    # Field names with custom keys
+    _key_lookup: ClassVar[dict[str, str]] = {
+        "nodes": "Nodes",
+        "elements": "Elements",
+        "node_sets": "NodeSet",
+        "surfaces": "Surface",
+    }
+
     def _convert_key(self, key: str) -> str:
-        key_lookup = {
-            "nodes": "Nodes",
-            "elements": "Elements",
-            "node_sets": "NodeSet",
-            "surfaces": "Surface",
-        }
-        return key_lookup[key] if key in key_lookup else super()._convert_key(key)
+        return (
+            self._key_lookup[key]
+            if key in self._key_lookup
+            else super()._convert_key(key)
+        )
@@ -1,8 +1,10 @@
 from dataclasses import dataclass
+from typing import ClassVar
 
-from .feb_base import FebBase
+from .feb_base import FebBase, add_slots
 
 
+@add_slots
 @dataclass
 class SolidDomain(FebBase):
     """FEBio > Mesh Domains > Solid Domain
@@ -58,8 +60,14 @@ class MeshDomains(FebBase):
 
     solid_domains: list[SolidDomain]
 
+    # Field names with custom keys
+    _key_lookup: ClassVar[dict[str, str]] = {
+        "solid_domains": "SolidDomain",
+    }
+
     def _convert_key(self, key: str) -> str:
-        key_lookup = {
-            "solid_domains": "SolidDomain",
-        }
-        return key_lookup[key] if key in key_lookup else super()._convert_key(key)
+        return (
+            self._key_lookup[key]
+            if key in self._key_lookup
+            else super()._convert_key(key)
+        )
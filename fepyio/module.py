@@ -1,9 +1,10 @@
 from dataclasses import dataclass
 from typing import Literal
 
-from .feb_base import FebBase
+from .feb_base import FebBase, add_slots
 
 
+@add_slots
 @dataclass
 class Module(FebBase):
     """Specify type of FEBio analysis.
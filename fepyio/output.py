@@ -1,9 +1,10 @@
 from dataclasses import dataclass, field
 from typing import Optional
 
-from .feb_base import FebBase
+from .feb_base import FebBase, add_slots
 
 
+@add_slots
 @dataclass
 class LogData(FebBase):
     """FEBio > Output > LogFile > LogData
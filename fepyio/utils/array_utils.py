@@ -0,0 +1,44 @@
+"""
+Format rows of numpy arrays as the comma-separated text used in .feb files.
+
+Example:
+    >>> join_rows(np.array([[0.0, 1.5], [2.0, 3.25]]))
+    ['0.0,1.5', '2.0,3.25']
+"""
+from itertools import starmap
+
+import numpy as np
+
+
+def join_rows(array: np.ndarray) -> list[str]:
+    """Return list of comma-separated strings for each row of a 2D array.
+
+    Same as ``[",".join(map(str, row)) for row in array]``, but converts values to
+    strings in bulk instead of calling str() on each numpy scalar.
+
+    Example
+    -------
+    >>> join_rows(np.array([[1, 2], [3, 4]]))
+    ['1,2', '3,4']
+    >>> join_rows(np.array([[3.0, 0.25]]))
+    ['3.0,0.25']
+    """
+    if np.issubdtype(array.dtype, np.integer):
+        # Python ints format the same as numpy ints, and much faster. One format string
+        # for the row width is applied to every row, without a join per row.
+        row_format = ",".join(["{}"] * array.shape[1])
+        return list(starmap(row_format.format, array.tolist()))
+
+    # Let numpy format other types so values match their numpy precision
+    return [",".join(row) for row in array.astype(str).tolist()]
+
+
+def row_ids(ids: np.ndarray) -> list:
+    """Return `ids` as Python ints when possible, since they format much faster.
+
+    Example
+    -------
+    >>> row_ids(np.array([1, 2]))
+    [1, 2]
+    """
+    return ids.tolist() if np.issubdtype(ids.dtype, np.integer) else list(ids)
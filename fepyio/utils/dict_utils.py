@@ -1,6 +1,4 @@
-import json
 from collections.abc import Sized
-from typing import OrderedDict
 
 
 def prune_dict(d: dict, *, prune_empty_iterables: bool = False) -> dict:
@@ -8,38 +6,45 @@ def prune_dict(d: dict, *, prune_empty_iterables: bool = False) -> dict:
 
     If prune_empty_iterables=True, iterables of length 0 will be pruned as well.
     """
-    if prune_empty_iterables:
-        return {
-            key: value
-            for (key, value) in d.items()
-            if value is not None and (not isinstance(value, Sized) or len(value) > 0)
-        }
-    return {key: value for (key, value) in d.items() if value is not None}
+    if not prune_empty_iterables:
+        return {key: value for (key, value) in d.items() if value is not None}
+    # Local name avoids a global lookup per item in the comprehension
+    _Sized = Sized
+    return {
+        key: value
+        for (key, value) in d.items()
+        if value is not None and (not isinstance(value, _Sized) or len(value))
+    }
 
 
 def prune_dict_inplace(d: dict) -> None:
-    """Remove keys in dictionary for 'None' values in place."""
-    for key in d:
-        if d[key] is None:
-            del d[key]
+    """Remove keys in dictionary for 'None' values in place.
+
+    Example
+    -------
+    >>> d = {'a': None, 'b': 1, 'c': None, 'd': []}
+    >>> prune_dict_inplace(d)
+    >>> d
+    {'b': 1, 'd': []}
+    """
+    # Collect keys first, since deleting while iterating over a dict raises an error
+    none_keys = [key for (key, value) in d.items() if value is None]
+    for key in none_keys:
+        del d[key]
 
 
 def unlist_dict(d: dict) -> dict:
     """Replace any single item list values with the single item. Return new dict."""
-    _dict = {}
-
-    for (key, value) in d.items():
-        # Left as 'if' tree for possible expansion
-        # If value is a list of length 1, use the first element as the value
-        _value = value[0] if isinstance(value, list) and len(value) == 1 else value
-        _dict[key] = _value
-
-    return _dict
-
-
-def to_dict(od: OrderedDict):
-    """Convert a nested OrderedDict to a dict. Only works on json serializable objects.
-
-    See: https://stackoverflow.com/a/27373073/
-    """
-    return json.loads(json.dumps(od))
+    return {
+        key: value[0] if isinstance(value, list) and len(value) == 1 else value
+        for (key, value) in d.items()
+    }
+
+
+def to_dict(od: dict):
+    """Convert a nested OrderedDict to a dict, recursing into dicts and lists."""
+    if isinstance(od, dict):
+        return {key: to_dict(value) for (key, value) in od.items()}
+    if isinstance(od, list):
+        return [to_dict(item) for item in od]
+    return od
@@ -0,0 +1,215 @@
+"""
+Stream xmltodict-style dictionaries to a text file as pretty-printed XML.
+
+The output is identical to ``xmltodict.unparse(..., pretty=True)``, but documents can be
+written one element at a time instead of building the whole dictionary in memory first.
+
+Example:
+    >>> import io
+    >>> out = io.StringIO()
+    >>> writer = XmlWriter(out)
+    >>> writer.start_element("Mesh", depth=0)
+    >>> writer.emit("Nodes", {"@name": "all", "node": [1, 2]}, depth=1)
+    >>> writer.end_element()
+    >>> print(out.getvalue().expandtabs(4))
+    <Mesh>
+        <Nodes name="all">
+            <node>1</node>
+            <node>2</node>
+        </Nodes>
+    </Mesh>
+"""
+from typing import Any, Iterable, Optional, TextIO
+
+
+# Same as xml.sax.saxutils.escape() and quoteattr(), which xmltodict uses.
+# xml.sax.saxutils is not imported since it pulls in urllib.request.
+def _escape(text: str) -> str:
+    """Escape '&', '<', and '>' in a string of data."""
+    return text.replace("&", "&amp;").replace(">", "&gt;").replace("<", "&lt;")
+
+
+def _quoteattr(text: str) -> str:
+    """Escape and quote an attribute value."""
+    text = _escape(text).replace("\n", "&#10;").replace("\r", "&#13;")
+    text = text.replace("\t", "&#9;")
+    if '"' in text:
+        if "'" in text:
+            return '"{}"'.format(text.replace('"', "&quot;"))
+        return f"'{text}'"
+    return f'"{text}"'
+
+
+class _Element:
+    """Element started by XmlWriter.start_element() and not yet ended."""
+
+    __slots__ = ("key", "attrs", "depth", "written", "has_children")
+
+    def __init__(self, key: str, attrs: dict[str, str], depth: int):
+        self.key = key
+        self.attrs = attrs
+        self.depth = depth
+        # Whether the start tag has been written
+        self.written = False
+        # Whether any child elements have been written
+        self.has_children = False
+
+
+class XmlWriter:
+    """Write pretty-printed XML to a text stream.
+
+    Start tags are written lazily so that elements without any content can be skipped,
+    matching how FebBase.to_dict() prunes empty values.
+
+    Parameters
+    ----------
+    out : TextIO
+        Text stream to write to.
+    newl : str, default="\\n"
+        Line separator.
+    indent : str, default="\\t"
+        Indentation for each level of depth.
+
+    Methods
+    -------
+    start_document()
+        Write the XML declaration.
+    start_element(key, attrs, depth)
+        Start an element. Must be closed with end_element().
+    end_element(skip_empty)
+        End the most recently started element.
+    emit(key, value, depth)
+        Write a complete xmltodict-style value as one or more elements.
+    characters(text)
+        Write text content of the most recently started element.
+    write_raw(text)
+        Write pre-formatted XML inside the most recently started element.
+    write_rows(key, ids, texts, depth)
+        Write numeric ``<key id="...">text</key>`` elements.
+    """
+
+    def __init__(self, out: TextIO, *, newl: str = "\n", indent: str = "\t"):
+        self._out = out
+        self._newl = newl
+        self._indent = indent
+        self._stack: list[_Element] = []
+
+    def start_document(self, encoding: str = "utf-8") -> None:
+        """Write the XML declaration."""
+        self._out.write(f'<?xml version="1.0" encoding="{encoding}"?>\n')
+
+    def start_element(
+        self, key: str, attrs: Optional[dict[str, Any]] = None, depth: int = 0
+    ) -> None:
+        """Start an element. Nothing is written until the element has content."""
+        _attrs = {name: str(value) for (name, value) in (attrs or {}).items()}
+        self._stack.append(_Element(key, _attrs, depth))
+
+    def end_element(self, skip_empty: bool = False) -> None:
+        """End the most recently started element.
+
+        If `skip_empty` is True and the element has neither attributes nor content, it
+        is not written at all.
+        """
+        element = self._stack[-1]
+
+        if not element.written:
+            if skip_empty and not element.attrs:
+                self._stack.pop()
+                return
+            self._open_ancestors()
+            self._write_start(element)
+
+        if element.has_children:
+            self._out.write(self._indent * element.depth)
+        self._out.write(f"</{element.key}>")
+        if element.depth:
+            self._out.write(self._newl)
+
+        self._stack.pop()
+
+    def characters(self, text: str) -> None:
+        """Write escaped text content of the most recently started element."""
+        if not self._stack[-1].written:
+            self._open_ancestors()
+            self._write_start(self._stack[-1])
+        self._out.write(_escape(text))
+
+    def write_raw(self, text: str) -> None:
+        """Write pre-formatted XML child elements without escaping.
+
+        Nothing is written for empty `text`, so the element is not opened for children.
+        """
+        if not text:
+            return
+        self._open_children(self._stack)
+        self._out.write(text)
+
+    def emit(self, key: str, value: Any, depth: int = 0) -> None:
+        """Write an xmltodict-style value under `key`.
+
+        Follows ``xmltodict.unparse`` conventions: '@' keys are attributes, '#text' is
+        text content, and iterables (except strings and dicts) are repeated elements.
+        """
+        if not hasattr(value, "__iter__") or isinstance(value, (str, dict)):
+            value = [value]
+
+        for v in value:
+            if v is None:
+                v = {}
+            elif isinstance(v, bool):
+                v = "true" if v else "false"
+            elif not isinstance(v, dict):
+                v = str(v)
+            if isinstance(v, str):
+                v = {"#text": v}
+
+            text = None
+            attrs = {}
+            children = []
+            for (ik, iv) in v.items():
+                if ik == "#text":
+                    text = iv
+                elif ik.startswith("@"):
+                    attrs[ik[1:]] = iv
+                else:
+                    children.append((ik, iv))
+
+            self.start_element(key, attrs, depth)
+            if children:
+                self._open_children(self._stack)
+            for (child_key, child_value) in children:
+                self.emit(child_key, child_value, depth + 1)
+            if text:
+                self.characters(str(text))
+            self.end_element()
+
+    def write_rows(
+        self, key: str, ids: Iterable[Any], texts: Iterable[str], depth: int
+    ) -> None:
+        """Write a ``<key id="...">text</key>`` element for each id and text pair.
+
+        Values are written without escaping, so they should be numeric.
+        """
+        template = f'{self._indent * depth}<{key} id="{{}}">{{}}</{key}>{self._newl}'
+        self.write_raw("".join([template.format(*row) for row in zip(ids, texts)]))
+
+    def _write_start(self, element: _Element) -> None:
+        self._out.write(self._indent * element.depth + f"<{element.key}")
+        for (name, value) in element.attrs.items():
+            self._out.write(f" {name}={_quoteattr(value)}")
+        self._out.write(">")
+        element.written = True
+
+    def _open_ancestors(self) -> None:
+        """Open every element enclosing the most recently started element."""
+        self._open_children(self._stack[:-1])
+
+    def _open_children(self, elements: list[_Element]) -> None:
+        """Write any pending start tags of `elements` before writing a child element."""
+        for element in elements:
+            if not element.written:
+                self._write_start(element)
+            if not element.has_children:
+                self._out.write(self._newl)
+                element.has_children = True
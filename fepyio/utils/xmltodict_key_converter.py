@@ -16,8 +16,10 @@ Example:
     |   "#text" | "__text" | "0.7, 3.0" |
     +-----------+----------+------------+
 """
+from functools import lru_cache
 
 
+@lru_cache(maxsize=None)
 def prop_to_xml(key: str) -> str:
     """Convert prefix of a key in python property syntax to xmltodict syntax.
 
@@ -45,15 +47,20 @@ def prop_to_xml(key: str) -> str:
     '#text'
     >>> prop_to_xml('value')
     'value'
+
+    Notes
+    -----
+    Results are cached since keys come from a small, fixed set of field names.
     """
-    if key.startswith("__"):
-        return key.replace("__", "#", 1)
-    elif key.startswith("_"):
-        return key.replace("_", "@", 1)
-    else:
+    if key[:1] != "_":
         return key
+    elif key[:2] == "__":
+        return "#" + key[2:]
+    else:
+        return "@" + key[1:]
 
 
+@lru_cache(maxsize=None)
 def xml_to_prop(key: str) -> str:
     """Convert prefix of a key in xmltodict syntax to python property.
 
@@ -74,17 +81,22 @@ def xml_to_prop(key: str) -> str:
 
     Example
     -------
-    >>> prop_to_xml('_id')
-    '@id'
-    >>> prop_to_xml('__text')
-    '#text'
-    >>> prop_to_xml('value')
+    >>> xml_to_prop('@id')
+    '_id'
+    >>> xml_to_prop('#text')
+    '__text'
+    >>> xml_to_prop('value')
     'value'
+
+    Notes
+    -----
+    Results are cached since keys come from a small, fixed set of field names.
     """
-    if key.startswith("#"):
-        return key.replace("#", "__", 1)
-    elif key.startswith("@"):
-        return key.replace("@", "_", 1)
+    prefix = key[:1]
+    if prefix == "#":
+        return "__" + key[1:]
+    elif prefix == "@":
+        return "_" + key[1:]
     else:
         return key
 
@@ -1,3 +1,5 @@
+from dataclasses import dataclass
+
 import numpy as np
 import pytest
 from dacite.exceptions import MissingValueError, WrongTypeError
@@ -6,7 +8,7 @@ from fepyio import material_types
 from fepyio.convert_materials import UnknownMaterialError, convert_to_materials
 
 
-@pytest.fixture(scope="class")
+@pytest.fixture(scope="session")
 def opts_materials() -> dict:
     return {
         "arterial": {
@@ -76,22 +78,24 @@ def opts_materials() -> dict:
     }
 
 
-@pytest.fixture(scope="class")
+@pytest.fixture(scope="session")
 def element_materials():
-    return np.array([3, 3, 3, 4, 4, 4, 5, 5, 5, 6, 6, 6, 7, 7, 7, 8, 8, 8])
+    return np.repeat(np.arange(3, 9), 3)
 
 
 class TestConvertToMaterials:
     def test_populate_materials(self, element_materials, opts_materials):
-        # Add coupled mooney-rivlin sample
-        old_fibrotic = opts_materials["fibrotic"]
-        opts_materials["fibrotic"] = {
-            "mat_type": "coupled Mooney-Rivlin",
-            "density": 1.0,
-            "id": 4,
-            "c1": 0.46,
-            "c2": 0.48,
-            "k": 0.5,
+        # Add coupled mooney-rivlin sample to a copy, since the fixture is shared
+        opts_materials = {
+            **opts_materials,
+            "fibrotic": {
+                "mat_type": "coupled Mooney-Rivlin",
+                "density": 1.0,
+                "id": 4,
+                "c1": 0.46,
+                "c2": 0.48,
+                "k": 0.5,
+            },
         }
 
         materials = convert_to_materials(element_materials, opts_materials)
@@ -113,9 +117,6 @@ class TestConvertToMaterials:
             k=0.5,
         )
 
-        # Restore opts_dictionary to not interfere with other tests
-        opts_materials["fibrotic"] = old_fibrotic
-
     def test_unsupported_material(self):
         unsupported_material_type = {
             "material": {
@@ -168,3 +169,20 @@ class TestConvertToMaterials:
 
         with pytest.raises(WrongTypeError):
             convert_to_materials(np.zeros(3), wrong_property_type)
+
+    def test_reregistered_material(self, opts_materials):
+        # Convert once so the builder for the original class is cached
+        convert_to_materials(np.array([1]), opts_materials)
+
+        @dataclass
+        class NewNeoHookean(material_types.NeoHookean):
+            pass
+
+        try:
+            material_types.register_material(NewNeoHookean)
+            materials = convert_to_materials(np.array([1]), opts_materials)
+        finally:
+            # Restore the original class to not interfere with other tests
+            material_types.register_material(material_types.NeoHookean)
+
+        assert type(materials[0]) is NewNeoHookean
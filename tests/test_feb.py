@@ -1,12 +1,13 @@
+import dataclasses
 import pkgutil
+import re
 from enum import Enum
+from functools import lru_cache
 from pprint import pformat
 from typing import Any
 
 import numpy as np
 import pytest
-import xmltodict
-from deepdiff import DeepDiff
 
 from fepyio import Feb, material_types
 from fepyio.boundary import Boundary, FixedBoundary
@@ -20,6 +21,7 @@ from fepyio.mesh import (
     Elements,
     ElementType,
     Face,
+    Faces,
     FaceType,
     Mesh,
     Nodes,
@@ -29,61 +31,109 @@ from fepyio.mesh import (
 from fepyio.mesh_domains import MeshDomains, SolidDomain
 from fepyio.module import Module
 from fepyio.output import LogData, LogFile, Output
-from fepyio.utils import dict_utils
+
+
+def strict_equal(value1: Any, value2: Any) -> bool:
+    """Return whether values are equal and have the same types at every level.
+
+    Unlike ==, this does not treat 1, 1.0, and np.int64(1) as the same value.
+    """
+    if type(value1) is not type(value2):
+        return False
+    if isinstance(value1, dict):
+        return value1.keys() == value2.keys() and all(
+            strict_equal(value, value2[key]) for (key, value) in value1.items()
+        )
+    if isinstance(value1, (list, tuple)):
+        return len(value1) == len(value2) and all(map(strict_equal, value1, value2))
+    return value1 == value2
 
 
 def assert_equal_dict(dict1: dict, dict2: dict, **kwargs):
+    # Skip the slow diff when the dicts are already equal in order, values, and types.
+    # Anything else, including type changes, is left to DeepDiff.
+    if strict_equal(dict1, dict2):
+        return
+
+    # Imported here since deepdiff is slow to import and only needed for failures
+    from deepdiff import DeepDiff
+
     diff = DeepDiff(
         dict1,
         dict2,
         ignore_order=True,
         **kwargs,
     )
-    assert diff == {}, f"Diff is not None: {pformat(diff)}"
+    if diff:
+        # Large meshes can produce huge diffs, so only show the start
+        message = pformat(diff)
+        if len(message) > 5000:
+            message = f"{message[:5000]}\n... ({len(message) - 5000} more characters)"
+        pytest.fail(f"Diff is not None: {message}")
+
+
+# Matches ints and floats, like "3", "-0.5", or "1e-3"
+_number_pattern = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
 
 
 def post_processor(path, key, value):
-    # Skip keys
+    # Skip keys and non-numeric values
     if key in {"@version", "#text"}:
         return (key, value)
+    if not isinstance(value, str) or not _number_pattern.fullmatch(value):
+        return (key, value)
 
-    # Try to convert values to float or int
-    try:
-        _value = float(value)
-        if _value.is_integer():
-            _value = int(_value)
+    # Convert values to int, or float unless the float is an integer
+    if "." not in value and "e" not in value and "E" not in value:
+        return (key, int(value))
+    _value = float(value)
+    if _value.is_integer():
+        return (key, int(_value))
+    return (key, _value)
 
-        return (key, _value)
-    except (ValueError, TypeError):
-        return (key, value)
 
+def canonical_dict(value: Any) -> Any:
+    """Sort dict keys and list items recursively, so order does not affect equality.
+
+    Comparing canonical dicts is equivalent to ``DeepDiff(..., ignore_order=True)``,
+    but the sorting is done once per fixture instead of in every diff.
+    """
+    if isinstance(value, dict):
+        return {key: canonical_dict(value[key]) for key in sorted(value)}
+    if isinstance(value, list):
+        return sorted((canonical_dict(item) for item in value), key=repr)
+    return value
 
+
+# Parsed files are shared, so tests must not mutate them
+@lru_cache(maxsize=None)
 def get_feb(relative_path: str) -> dict[str, Any]:
+    # Imported here since xmltodict is slow to import and only needed for some tests
+    import xmltodict
+
     file = pkgutil.get_data(__name__, relative_path)
     assert file is not None
-    xml = xmltodict.parse(file, postprocessor=post_processor)
-    # Convert to standard dict so the deepdiffs are more readable.
-    return dict_utils.to_dict(xml)  # type: ignore
+    # Parse to standard dicts so the deepdiffs are more readable.
+    return xmltodict.parse(file, postprocessor=post_processor, dict_constructor=dict)
 
 
 # FEB Files
 
 
-@pytest.fixture(scope="class")
-def feb_file1(request):
-    request.cls.feb_file1 = get_feb("data/Model1.feb")
-    # with open(file_path, "rb") as file:
+@pytest.fixture(scope="session")
+def feb_file1():
+    return canonical_dict(get_feb("data/Model1.feb"))
 
 
-@pytest.fixture(scope="class")
-def feb_file2(request):
-    request.cls.feb_file2 = get_feb("data/Model2.feb")
+@pytest.fixture(scope="session")
+def feb_file2():
+    return canonical_dict(get_feb("data/Model2.feb"))
 
 
 # FEB Object Components
 
 
-@pytest.fixture(scope="class")
+@pytest.fixture(scope="session")
 def load_curves():
     return {
         "tuple-list": LoadCurve(
@@ -109,7 +159,7 @@ def load_curves():
     }
 
 
-@pytest.fixture(scope="class")
+@pytest.fixture(scope="session")
 def control():
     return Control(
         analysis="STATIC",
@@ -137,7 +187,7 @@ def control():
     )
 
 
-@pytest.fixture(scope="class")
+@pytest.fixture(scope="session")
 def feb_globals():
     return Globals(
         R=0,
@@ -146,7 +196,7 @@ def feb_globals():
     )
 
 
-@pytest.fixture(scope="class")
+@pytest.fixture(scope="session")
 def feb_materials():
     return {
         "neo-Hookean": material_types.NeoHookean(
@@ -167,9 +217,9 @@ def feb_materials():
     }
 
 
-@pytest.fixture(scope="class")
-def feb_obj1(request, load_curves, control, feb_globals, feb_materials):
-    request.cls.feb_obj1 = Feb(
+@pytest.fixture(scope="session")
+def feb_obj1(load_curves, control, feb_globals, feb_materials):
+    return Feb(
         module=Module("solid"),
         control=control,
         globals=feb_globals,
@@ -179,7 +229,7 @@ def feb_obj1(request, load_curves, control, feb_globals, feb_materials):
                 Nodes(
                     name="AllNodes",
                     coords=np.array([[0, 0, 0]]),
-                    ids=np.arange(1) + 1,
+                    ids=np.arange(1, 2),
                 )
             ],
             elements=[
@@ -244,12 +294,10 @@ def feb_obj1(request, load_curves, control, feb_globals, feb_materials):
         ),
     )
 
-    request.cls.feb_dict1 = request.cls.feb_obj1.to_dict()
 
-
-@pytest.fixture(scope="class")
-def feb_obj2(request, load_curves, control, feb_globals, feb_materials):
-    request.cls.feb_obj2 = Feb(
+@pytest.fixture(scope="session")
+def feb_obj2(load_curves, control, feb_globals, feb_materials):
+    return Feb(
         module=Module("solid"),
         control=control,
         globals=feb_globals,
@@ -270,7 +318,7 @@ def feb_obj2(request, load_curves, control, feb_globals, feb_materials):
                             [3.5, 0, 0],
                         ]
                     ),
-                    ids=np.arange(3) + 1,
+                    ids=np.arange(1, 4),
                 ),
                 Nodes(
                     name="Object04",
@@ -281,49 +329,41 @@ def feb_obj2(request, load_curves, control, feb_globals, feb_materials):
                             [1.06066017, -1.06066017, 0],
                         ]
                     ),
-                    ids=np.arange(3) + 1441,
+                    ids=np.arange(1441, 1444),
                 ),
             ],
             elements=[
                 Elements(
                     type=ElementType.HEX8,
                     name="Part8",
-                    elements=np.arange(24).reshape(3, 8) + 1,
-                    ids=np.arange(3) + 1,
+                    elements=np.arange(1, 25).reshape(3, 8),
+                    ids=np.arange(1, 4),
                 ),
                 Elements(
                     type=ElementType.TET4,
                     name="Part7",
-                    elements=np.arange(12).reshape(3, 4) + 1,
-                    ids=np.arange(3) + 1,
+                    elements=np.arange(1, 13).reshape(3, 4),
+                    ids=np.arange(1, 4),
                 ),
                 Elements(
                     type=ElementType.TET4,
                     name="Part6",
-                    elements=np.arange(12).reshape(3, 4) + 11,
-                    ids=np.arange(3) + 4,
+                    elements=np.arange(11, 23).reshape(3, 4),
+                    ids=np.arange(4, 7),
                 ),
             ],
             surfaces=[
-                Surface(
-                    name="fixed",
-                    faces=[
-                        Face(type=FaceType.QUAD4, nodes=_nodes, id=_id)
-                        for (_nodes, _id) in zip(
-                            np.arange(12).reshape(3, 4) + 13,
-                            np.arange(3) + 1,
-                        )
-                    ],
+                Surface.from_arrays(
+                    "fixed",
+                    FaceType.QUAD4,
+                    ids=np.arange(1, 4),
+                    nodes=np.arange(13, 25).reshape(3, 4),
                 ),
-                Surface(
-                    name="BP",
-                    faces=[
-                        Face(type=FaceType.TRI3, nodes=_nodes, id=_id)
-                        for (_nodes, _id) in zip(
-                            np.arange(9).reshape(3, 3) + 1,
-                            np.arange(3) + 4,
-                        )
-                    ],
+                Surface.from_arrays(
+                    "BP",
+                    FaceType.TRI3,
+                    ids=np.arange(4, 7),
+                    nodes=np.arange(1, 10).reshape(3, 3),
                 ),
                 Surface(
                     name="Surf3",
@@ -331,8 +371,8 @@ def feb_obj2(request, load_curves, control, feb_globals, feb_materials):
                         Face(type=_type, nodes=_nodes, id=_id)  # type: ignore
                         for (_type, _nodes, _id) in zip(
                             [FaceType.TRI3, FaceType.TRI3, FaceType.QUAD4],
-                            [np.arange(3) + 1, np.arange(3) + 4, np.arange(4) + 7],
-                            np.arange(3) + 7,
+                            [np.arange(1, 4), np.arange(4, 7), np.arange(7, 11)],
+                            np.arange(7, 10),
                         )
                     ],
                 ),
@@ -415,155 +455,65 @@ def feb_obj2(request, load_curves, control, feb_globals, feb_materials):
         ),
     )
 
-    request.cls.feb_dict2 = request.cls.feb_obj2.to_dict()
 
+@pytest.fixture(scope="session")
+def feb_dict1(feb_obj1):
+    return canonical_dict(feb_obj1.to_dict())
 
-# FEB File tests
 
+@pytest.fixture(scope="session")
+def feb_dict2(feb_obj2):
+    return canonical_dict(feb_obj2.to_dict())
 
-@pytest.mark.usefixtures(
-    "feb_file1",
-    "feb_obj1",
-    "load_curves",
-    "feb_file2",
-    "feb_obj2",
-)
-class TestFebCreation:
-    # Need to assign something to the types for the linter to pick up on, but
-    # they're actually assigned as fixtures
-    feb_obj1: Feb
-    feb_file1: dict
-    feb_dict1: dict
-
-    feb_obj2: Feb
-    feb_file2: dict
-    feb_dict2: dict
-
-    def test_version(self):
-        assert (
-            self.feb_dict1["febio_spec"]["@version"]
-            == self.feb_file1["febio_spec"]["@version"]
-        )
-        assert (
-            self.feb_dict2["febio_spec"]["@version"]
-            == self.feb_file2["febio_spec"]["@version"]
-        )
-
-    def test_top_level_spec(self):
-        # Make sure top level keys are equal
-        assert self.feb_dict1.keys() == self.feb_file1.keys()
-
-        # Compare second-level keys are equivalent
-        assert (
-            self.feb_dict1["febio_spec"].keys() == self.feb_file1["febio_spec"].keys()
-        )
 
-        # Check model2
-        assert self.feb_dict2.keys() == self.feb_file2.keys()
-        assert (
-            self.feb_dict2["febio_spec"].keys() == self.feb_file2["febio_spec"].keys()
-        )
+# FEB File tests
 
-    def test_module(self):
-        assert_equal_dict(
-            self.feb_file1["febio_spec"]["Module"],
-            self.feb_dict1["febio_spec"]["Module"],
-        )
-        assert_equal_dict(
-            self.feb_file2["febio_spec"]["Module"],
-            self.feb_dict2["febio_spec"]["Module"],
-        )
 
-    def test_control(self):
-        assert_equal_dict(
-            self.feb_file1["febio_spec"]["Control"],
-            self.feb_dict1["febio_spec"]["Control"],
-        )
-        assert_equal_dict(
-            self.feb_file2["febio_spec"]["Control"],
-            self.feb_dict2["febio_spec"]["Control"],
-        )
+class TestFebCreation:
+    # Fixtures are session scoped and shared, so tests must not mutate them
 
-    def test_globals(self):
-        assert_equal_dict(
-            self.feb_file1["febio_spec"]["Globals"],
-            self.feb_dict1["febio_spec"]["Globals"],
-        )
-        assert_equal_dict(
-            self.feb_file2["febio_spec"]["Globals"],
-            self.feb_dict2["febio_spec"]["Globals"],
-        )
+    @pytest.mark.parametrize("model", [1, 2])
+    def test_structure(self, request, model):
+        feb_file = request.getfixturevalue(f"feb_file{model}")
+        feb_dict = request.getfixturevalue(f"feb_dict{model}")
 
-    def test_material(self):
-        assert_equal_dict(
-            self.feb_file1["febio_spec"]["Material"],
-            self.feb_dict1["febio_spec"]["Material"],
-        )
-        assert_equal_dict(
-            self.feb_file2["febio_spec"]["Material"],
-            self.feb_dict2["febio_spec"]["Material"],
-        )
+        assert feb_dict["febio_spec"]["@version"] == feb_file["febio_spec"]["@version"]
 
-    def test_mesh(self):
-        assert_equal_dict(
-            self.feb_file1["febio_spec"]["Mesh"],
-            self.feb_dict1["febio_spec"]["Mesh"],
-            ignore_numeric_type_changes=True,
-        )
-        assert_equal_dict(
-            self.feb_file2["febio_spec"]["Mesh"],
-            self.feb_dict2["febio_spec"]["Mesh"],
-            ignore_numeric_type_changes=True,
-        )
+        # Make sure top level keys are equal
+        assert feb_dict.keys() == feb_file.keys()
 
-    def test_mesh_domains(self):
-        assert_equal_dict(
-            self.feb_file1["febio_spec"]["MeshDomains"],
-            self.feb_dict1["febio_spec"]["MeshDomains"],
-        )
-        assert_equal_dict(
-            self.feb_file2["febio_spec"]["MeshDomains"],
-            self.feb_dict2["febio_spec"]["MeshDomains"],
-        )
+        # Compare second-level keys are equivalent
+        assert feb_dict["febio_spec"].keys() == feb_file["febio_spec"].keys()
 
-    def test_boundary(self):
-        assert_equal_dict(
-            self.feb_file1["febio_spec"]["Boundary"],
-            self.feb_dict1["febio_spec"]["Boundary"],
-            ignore_type_in_groups=(str, Enum),
-        )
+    @pytest.mark.parametrize(
+        ("section", "kwargs"),
+        [
+            ("Module", {}),
+            ("Control", {}),
+            ("Globals", {}),
+            ("Material", {}),
+            ("Mesh", {"ignore_numeric_type_changes": True}),
+            ("MeshDomains", {}),
+            ("Boundary", {"ignore_type_in_groups": (str, Enum)}),
+            ("Loads", {}),
+            ("LoadData", {}),
+            ("Output", {}),
+        ],
+    )
+    @pytest.mark.parametrize("model", [1, 2])
+    def test_section(self, request, model, section, kwargs):
         assert_equal_dict(
-            self.feb_file2["febio_spec"]["Boundary"],
-            self.feb_dict2["febio_spec"]["Boundary"],
+            request.getfixturevalue(f"feb_file{model}")["febio_spec"][section],
+            request.getfixturevalue(f"feb_dict{model}")["febio_spec"][section],
+            **kwargs,
         )
 
-        # Check key
+    def test_boundary_key(self):
         assert FixedBoundary("Name", "Set", dofs=("x", "y", "z"))._key == "bc"
 
-    def test_loads(self):
+    def test_load_data_ndarray(self, feb_file1, load_curves):
         assert_equal_dict(
-            self.feb_file1["febio_spec"]["Loads"],
-            self.feb_dict1["febio_spec"]["Loads"],
-        )
-        assert_equal_dict(
-            self.feb_file2["febio_spec"]["Loads"],
-            self.feb_dict2["febio_spec"]["Loads"],
-        )
-
-    def test_load_data(self, load_curves):
-        # Try from full Feb object
-        assert_equal_dict(
-            self.feb_file1["febio_spec"]["LoadData"],
-            self.feb_dict1["febio_spec"]["LoadData"],
-        )
-        assert_equal_dict(
-            self.feb_file2["febio_spec"]["LoadData"],
-            self.feb_dict2["febio_spec"]["LoadData"],
-        )
-
-        # Try ndarray loadcurve
-        assert_equal_dict(
-            self.feb_file1["febio_spec"]["LoadData"]["load_controller"],
+            feb_file1["febio_spec"]["LoadData"]["load_controller"],
             load_curves["ndarray"].to_dict(),
         )
 
@@ -574,107 +524,141 @@ class TestFebCreation:
         with pytest.raises(ArrayShapeError):
             LoadCurve(id=0, points=points, interpolate="linear")
 
-    def test_output(self):
-        assert_equal_dict(
-            self.feb_file1["febio_spec"]["Output"],
-            self.feb_dict1["febio_spec"]["Output"],
-        )
-        assert_equal_dict(
-            self.feb_file2["febio_spec"]["Output"],
-            self.feb_dict2["febio_spec"]["Output"],
+    def test_save_feb(self, tmp_path, feb_obj1, feb_obj2):
+        import xmltodict
+
+        # Mesh with empty arrays. Copied since the session fixtures are shared.
+        empty_mesh = dataclasses.replace(
+            feb_obj1.mesh,
+            nodes=[
+                *feb_obj1.mesh.nodes,
+                Nodes(name="empty", coords=np.empty((0, 3)), ids=np.empty(0, int)),
+            ],
+            elements=[
+                *feb_obj1.mesh.elements,
+                Elements(
+                    name="empty",
+                    type=ElementType.TET4,
+                    elements=np.empty((0, 4), int),
+                    ids=np.empty(0, int),
+                ),
+            ],
+            surfaces=[
+                *feb_obj1.mesh.surfaces,
+                Surface.from_arrays(
+                    "empty", FaceType.TRI3, np.empty(0, int), np.empty((0, 3), int)
+                ),
+            ],
         )
+        feb_empty = dataclasses.replace(feb_obj1, mesh=empty_mesh)
 
+        # Streamed file should match unparsing the full dictionary. The fixture dicts
+        # are sorted, so the dictionary is built again in its original order.
+        for feb_obj in [feb_obj1, feb_obj2, feb_empty]:
+            file_path = tmp_path / "model.feb"
+            feb_obj.save_feb(str(file_path))
 
-class TestFebMesh:
-    def test_nodes_errors(self):
-        # Wrong coords shape
-        with pytest.raises(ArrayShapeError):
-            Nodes(name="nodes", coords=np.zeros(5), ids=np.zeros(3))
+            assert file_path.read_text(encoding="utf-8") == xmltodict.unparse(
+                feb_obj.to_dict(), pretty=True
+            )
 
-        with pytest.raises(ArrayShapeError):
-            Nodes(name="nodes", coords=np.zeros((5, 3, 2)), ids=np.zeros(3))
+        # Empty arrays should not open their element
+        assert '<Nodes name="empty"></Nodes>' in file_path.read_text(encoding="utf-8")
 
-        # Wrong ids shape
-        with pytest.raises(ArrayShapeError):
-            Nodes(name="nodes", coords=np.zeros((5, 3, 2)), ids=np.zeros((5, 3)))
 
-        # Coords/ids shape mismatch
+class TestFebMesh:
+    @pytest.mark.parametrize(
+        ("coords_shape", "ids_shape"),
+        [
+            pytest.param((5,), (3,), id="coords-dims"),
+            pytest.param((5, 3, 2), (3,), id="coords-dims-3d"),
+            pytest.param((5, 3, 2), (5, 3), id="ids-dims"),
+            pytest.param((5, 3), (3,), id="coords-ids-mismatch"),
+        ],
+    )
+    def test_nodes_errors(self, coords_shape, ids_shape):
         with pytest.raises(ArrayShapeError):
-            Nodes(name="nodes", coords=np.zeros((5, 3)), ids=np.zeros(3))
-
-    def test_elements_errors(self):
-        # Wrong array dimensions
-        with pytest.raises(ArrayShapeError):
-            Elements(
-                name="elms",
-                type=ElementType.TET4,
-                elements=np.zeros(5),
-                ids=np.zeros(5),
-            )
+            Nodes(name="nodes", coords=np.zeros(coords_shape), ids=np.zeros(ids_shape))
 
+    @pytest.mark.parametrize(
+        ("type", "elements_shape", "ids_shape"),
+        [
+            pytest.param(ElementType.TET4, (5,), (5,), id="elements-dims"),
+            pytest.param(ElementType.TET4, (5, 4, 1), (5,), id="elements-dims-3d"),
+            pytest.param(ElementType.TET4, (5, 8), (5,), id="tet4-nodes"),
+            pytest.param(ElementType.TET10, (5, 4), (5,), id="tet10-nodes"),
+            pytest.param(ElementType.TET4, (5, 4), (4,), id="ids-length"),
+            pytest.param(ElementType.TET4, (5, 4), (5, 2), id="ids-dims"),
+            pytest.param(ElementType.TET4, (5, 4), (3,), id="elements-ids-mismatch"),
+        ],
+    )
+    def test_elements_errors(self, type, elements_shape, ids_shape):
         with pytest.raises(ArrayShapeError):
             Elements(
                 name="elms",
-                type=ElementType.TET4,
-                elements=np.zeros((5, 4, 1)),
-                ids=np.zeros(5),
+                type=type,
+                elements=np.zeros(elements_shape),
+                ids=np.zeros(ids_shape),
             )
 
-        # Wrong elements per type
+    def test_node_set_errors(self):
         with pytest.raises(ArrayShapeError):
-            Elements(
-                name="elms",
-                type=ElementType.TET4,
-                elements=np.zeros((5, 8)),
-                ids=np.zeros(5),
-            )
+            NodeSet(name="nodeset", node_ids=np.zeros((5, 2)))
 
+    @pytest.mark.parametrize(
+        ("type", "nodes_shape"),
+        [
+            pytest.param(FaceType.QUAD4, (4, 2), id="nodes-dims"),
+            pytest.param(FaceType.QUAD4, (3,), id="quad4-nodes"),
+            pytest.param(FaceType.TRI3, (4,), id="tri3-nodes"),
+        ],
+    )
+    def test_face_errors(self, type, nodes_shape):
         with pytest.raises(ArrayShapeError):
-            Elements(
-                name="elms",
-                type=ElementType.TET10,
-                elements=np.zeros((5, 4)),
-                ids=np.zeros(5),
-            )
+            Face(type=type, nodes=np.zeros(nodes_shape), id=0)
 
-        # Wrong ids shape
-        with pytest.raises(ArrayShapeError):
-            Elements(
-                name="elms",
-                type=ElementType.TET4,
-                elements=np.zeros((5, 4)),
-                ids=np.zeros(4),
-            )
+    def test_face_from_array(self):
+        nodes = np.array([[1, 2, 3], [4, 5, 6]])
+        faces = Face.from_array(FaceType.TRI3, np.array([1, 2]), nodes)
 
-        with pytest.raises(ArrayShapeError):
-            Elements(
-                name="elms",
-                type=ElementType.TET4,
-                elements=np.zeros((5, 4)),
-                ids=np.zeros((5, 2)),
-            )
+        for (face, _id, face_nodes) in zip(faces, [1, 2], nodes):
+            expected = Face(type=FaceType.TRI3, id=_id, nodes=face_nodes)
+            assert face.type == expected.type
+            assert face.id == expected.id
+            assert face._key == expected._key
+            np.testing.assert_array_equal(face.nodes, expected.nodes)
 
-        # elements / ids shape mismatch
+        # Wrong node count for type
         with pytest.raises(ArrayShapeError):
-            Elements(
-                name="elms",
-                type=ElementType.TET4,
-                elements=np.zeros((5, 4)),
-                ids=np.zeros((3)),
-            )
+            Face.from_array(FaceType.QUAD4, np.array([1, 2]), nodes)
 
-    def test_node_set_errors(self):
+        # ids / nodes shape mismatch
         with pytest.raises(ArrayShapeError):
-            NodeSet(name="nodeset", node_ids=np.zeros((5, 2)))
+            Face.from_array(FaceType.TRI3, np.array([1]), nodes)
 
-    def test_face_errors(self):
-        # Wrong node shape
-        with pytest.raises(ArrayShapeError):
-            Face(type=FaceType.QUAD4, nodes=np.zeros((4, 2)), id=0)
+    def test_surface_from_arrays(self):
+        ids = np.array([1, 2])
+        nodes = np.array([[1, 2, 3], [4, 5, 6]])
+        quad = Face(type=FaceType.QUAD4, id=3, nodes=np.array([1, 2, 3, 4]))
 
-        # Wrong node count
-        with pytest.raises(ArrayShapeError):
-            Face(type=FaceType.QUAD4, nodes=np.zeros(3), id=0)
+        # Faces stored as arrays should match the same faces as Face objects
+        assert_equal_dict(
+            Surface(
+                name="surface",
+                faces=[Faces(type=FaceType.TRI3, ids=ids, nodes=nodes), quad],
+            ).to_dict(),
+            Surface(
+                name="surface",
+                faces=[*Face.from_array(FaceType.TRI3, ids, nodes), quad],
+            ).to_dict(),
+        )
+        assert_equal_dict(
+            Surface.from_arrays("surface", FaceType.TRI3, ids, nodes).to_dict(),
+            Surface(
+                name="surface", faces=Face.from_array(FaceType.TRI3, ids, nodes)
+            ).to_dict(),
+        )
 
+        # Wrong node count for type
         with pytest.raises(ArrayShapeError):
-            Face(type=FaceType.TRI3, nodes=np.zeros(4), id=0)
+            Faces(type=FaceType.QUAD4, ids=ids, nodes=nodes)